@@ -33,6 +33,8 @@ class BinaryPolynomial:
     >>> poly1**2  # X^8 + X^4
     BinaryPolynomial(0b100010000)
     """
+    __slots__ = ('_integer',)
+
     def __init__(self, integer):
         self._integer = int(integer)
 
@@ -101,7 +103,7 @@ class BinaryPolynomial:
         >>> poly.coefficients(width=8)
         array([0, 1, 0, 1, 1, 0, 0, 0])
         """
-        return np.array(_int2binlist(self._integer, width=width), dtype=np.int)
+        return _int2binlist(self._integer, width=width)
 
     def exponents(self):
         """
@@ -130,30 +132,33 @@ class BinaryPolynomial:
         return int(self) == int(other)
 
     def __lshift__(self, n):
-        return self.__class__(self._integer.__lshift__(n))
+        return self.__class__(self._integer << n)
 
     def __rshift__(self, n):
-        return self.__class__(self._integer.__rshift__(n))
+        return self.__class__(self._integer >> n)
 
     def __add__(self, other):
-        return self.__class__(self._integer.__xor__(other._integer))
+        return self.__class__(self._integer ^ other._integer)
 
     def __sub__(self, other):
-        return self.__class__(self._integer.__xor__(other._integer))
+        return self.__class__(self._integer ^ other._integer)
 
     def __mul__(self, other):
-        return self.from_coefficients(np.convolve(self.coefficients(), other.coefficients()) % 2)
+        return self.__class__(_clmul(self._integer, int(other)))
 
     def __pow__(self, exponent):
         return power(self, exponent, self.__class__)
 
     def __divmod__(self, den):
         div, mod, den = 0, self._integer, den._integer
-        d = mod.bit_length() - den.bit_length()
-        while d >= 0:
-            div ^= (1 << d)
-            mod ^= (den << d)
-            d = mod.bit_length() - den.bit_length()
+        if den == 0:
+            raise ZeroDivisionError('Divisor cannot be zero')
+        mod_length, den_length = mod.bit_length(), den.bit_length()
+        while mod_length >= den_length:
+            shift = mod_length - den_length
+            div |= 1 << shift
+            mod ^= den << shift
+            mod_length = mod.bit_length()
         return self.__class__(div), self.__class__(mod)
 
     def __floordiv__(self, other):
@@ -373,6 +378,52 @@ class FiniteBifield:
 
         assert self._modulus.degree == self._degree
 
+        self._modulus_hash = hash(self._modulus)
+        self._reduce = self._sparse_reducer()
+        # Bounded per-field caches for the paths used when there are no logarithm tables.
+        self._inverse_cached = functools.lru_cache(maxsize=4096)(self._inverse_without_tables)
+        self._logarithm_cached = functools.lru_cache(maxsize=4096)(self._logarithm_without_tables)
+        self._exp, self._log = self._logarithm_tables()
+
+    def _sparse_reducer(self):
+        # Returns a function reducing an integer (as a binary polynomial) modulo p(X). Since X^k = r(X) mod p(X), where
+        # r(X) = p(X) - X^k has only a few terms, the part above degree k is repeatedly folded back with one shift and
+        # one xor per term of r(X), instead of the general shift-and-xor division.
+        k, mask = self._degree, (1 << self._degree) - 1
+        tail_exponents = [int(e) for e in self._modulus.exponents() if e < k]
+
+        def reduce(y):
+            high = y >> k
+            while high:
+                y &= mask
+                for e in tail_exponents:
+                    y ^= high << e
+                high = y >> k
+            return y
+
+        return reduce
+
+    def _logarithm_tables(self):
+        # Antilogarithm (exp) and logarithm (log) tables with respect to the primitive element. The exp table has
+        # length 2 * (order - 1), so that the sum of two logarithms can index it without a modulo operation. Tables
+        # are only built for degrees up to 16 and when the modulus is indeed primitive; otherwise (None, None).
+        order, modulus = self.order, int(self._modulus)
+        if self._degree > 16:
+            return None, None
+        exp = np.empty(2 * (order - 1), dtype=np.int64)
+        log = np.full(order, -1, dtype=np.int64)
+        a = 1
+        for i in range(order - 1):
+            if log[a] != -1:
+                return None, None
+            exp[i] = a
+            log[a] = i
+            a <<= 1
+            if a & order:
+                a ^= modulus
+        exp[order - 1:] = exp[:order - 1]
+        return exp, log
+
     @property
     def characteristic(self):
         """
@@ -406,58 +457,108 @@ class FiniteBifield:
         """
         A primitive element :math:`\\alpha` of the finite field. It satisfies :math:`p(\\alpha) = 0`, where :math:`p(X)` is the modulus (primitive polynomial) of the finite field. This property is read-only.
         """
-        return self(2)
+        return self(self._reduce(2))
+
+    def _reduced(self, x):
+        # Element values are not reduced on construction, but the logarithm tables only cover [0, order).
+        x = int(x)
+        return x if x < self.order else self._reduce(x)
+
+    def _reduced_array(self, x):
+        x = np.asarray(x)
+        if np.any(x >= self.order):
+            x = np.vectorize(self._reduce, otypes=[np.int64])(x)
+        return x
 
-    # ~@functools.lru_cache(maxsize=None)
     def _multiply(self, x, y):
-        return self((BinaryPolynomial(x) * BinaryPolynomial(y)) % self._modulus)
+        x, y = self._reduced(x), self._reduced(y)
+        if not x or not y:
+            return self(0)
+        if self._log is not None:
+            return self(self._exp[self._log[x] + self._log[y]])
+        return self(self._reduce(_clmul(int(x), int(y))))
 
-    # ~@functools.lru_cache(maxsize=None)
     def inverse(self, x):
         """
         Returns the multiplicative inverse of a given element.
         """
+        x = self._reduced(x)
+        if not x:
+            raise ZeroDivisionError('This element does not have a multiplicative inverse')
+        if self._log is not None:
+            return self(self._exp[self.order - 1 - self._log[x]])
+        return self(self._inverse_cached(x))
+
+    def _inverse_without_tables(self, x):
         d, s, _ = BinaryPolynomial.xgcd(BinaryPolynomial(x), self._modulus)
         if d._integer == 1:
-            return self(s)
+            return int(s)
         else:
             raise ZeroDivisionError('This element does not have a multiplicative inverse')
 
-    # ~@functools.lru_cache(maxsize=None)
     def logarithm(self, x, base=None):
         """
         Returns the logarithm of a given element, with respect to a given base.
         """
         if base is None:
             base = self.primitive_element
-        for i in range(self.order):
-            if base**i == x:
-                return i
+        x, base = self._reduced(x), self._reduced(base)
+        if self._log is not None and base == int(self.primitive_element):
+            return int(self._log[x])
+        return self._logarithm_cached(x, base)
+
+    def _logarithm_without_tables(self, x, base):
+        if base == 0:
+            # Only 0**0 == 1 and 0**i == 0 (for i > 0) are reachable.
+            return {1: 0, 0: 1}.get(x, -1)
+        # Baby-step giant-step: O(sqrt(order)) multiplications instead of a linear search.
+        if x == 0:
+            return -1
+        base = self(base)
+        m = 1 << ((self._degree + 1) // 2)  # m**2 >= order
+        baby_steps = {}
+        gamma = self(1)
+        for j in range(m):
+            baby_steps.setdefault(int(gamma), j)
+            gamma = gamma * base
+        factor = self.power(base, -m)
+        gamma = self(x)
+        for i in range(m):
+            if int(gamma) in baby_steps:
+                return i * m + baby_steps[int(gamma)]
+            gamma = gamma * factor
         return -1
 
     def power(self, x, exponent):
         """
         Returns a given power of a given element.
         """
+        x = self._reduced(x)
+        if self._log is not None and x:
+            return self(self._exp[(int(self._log[x]) * exponent) % (self.order - 1)])
         if exponent < 0:
             return power(self.inverse(x), -exponent, self)
         else:
-            return power(x, exponent, self)
+            return power(self(x), exponent, self)
 
     @staticmethod
     def conjugates(x):
         """
         Returns the conjugates of a given element. See :cite:`Lin.Costello.04` (Sec. 2.5) for more details.
         """
+        field = x.field
+        x = field(field._reduced(x))
+        if field._log is not None and x:
+            # In the log domain, x^(2^i) is just (2^i log x) mod (order - 1).
+            logs = (field._log[x] << np.arange(field._degree)) % (field.order - 1)
+            values = field._exp[logs]
+            _, indices = np.unique(values, return_index=True)
+            return [field(v) for v in values[np.sort(indices)]]
         conjugate_list = []
-        exponent = 0
-        while True:
-            y = x**(2**exponent)
-            if y not in conjugate_list:
-                conjugate_list.append(y)
-            else:
-                break
-            exponent += 1
+        y = x
+        while y not in conjugate_list:
+            conjugate_list.append(y)
+            y = y * y
         return conjugate_list
 
     @staticmethod
@@ -465,10 +566,53 @@ class FiniteBifield:
         """
         Returns the minimal polynomial of a given element. See :cite:`Lin.Costello.04` (Sec. 2.5) fore more details.
         """
-        one = x.field(1)
-        monomials = [np.array([y, one], dtype=np.object) for y in x.conjugates()]
-        coefficients = functools.reduce(np.convolve, monomials)
-        return BinaryPolynomial.from_coefficients(int(c) for c in coefficients)
+        field = x.field
+        if field._log is None:
+            one = field(1)
+            monomials = [[y, one] for y in x.conjugates()]
+            return BinaryPolynomial.from_coefficients(int(c) for c in functools.reduce(_polymul, monomials))
+        coefficients = np.ones(1, dtype=np.int64)
+        for y in x.conjugates():
+            # Multiply by the monomial (X + y).
+            product = np.zeros(coefficients.size + 1, dtype=np.int64)
+            product[1:] = coefficients
+            product[:-1] ^= field.multiply_vec(int(y), coefficients)
+            coefficients = product
+        return BinaryPolynomial.from_coefficients(coefficients)
+
+    def multiply_vec(self, x, y):
+        """
+        Returns the elementwise product of two arrays of field elements (given by their integer representations).
+
+        .. rubric:: Examples
+
+        >>> field = komm.FiniteBifield(4)
+        >>> field.multiply_vec([0b1011, 0b0010, 0], [0b1100, 0b1001, 0b0111])
+        array([13,  1,  0])
+        """
+        x, y = self._reduced_array(x), self._reduced_array(y)
+        if self._log is None:
+            return np.vectorize(lambda a, b: int(self._multiply(int(a), int(b))), otypes=[np.int64])(x, y)
+        mask = (x != 0) & (y != 0)
+        return np.where(mask, self._exp[self._log[x] + self._log[y]], 0)
+
+    def power_vec(self, x, exponent):
+        """
+        Returns a given power of each element of an array of field elements (given by their integer representations).
+
+        .. rubric:: Examples
+
+        >>> field = komm.FiniteBifield(4)
+        >>> field.power_vec([0b0010, 0b0011, 0], 4)
+        array([3, 2, 0])
+        """
+        x = self._reduced_array(x)
+        if self._log is None:
+            return np.vectorize(lambda a: int(self.power(self(int(a)), exponent)), otypes=[np.int64])(x)
+        if exponent < 0 and np.any(x == 0):
+            raise ZeroDivisionError('This element does not have a multiplicative inverse')
+        logs = (self._log[x] * (exponent % (self.order - 1))) % (self.order - 1)
+        return np.where(x != 0, self._exp[logs], 1 if exponent == 0 else 0)
 
     def __repr__(self):
         args = '{}'.format(self._degree)
@@ -488,8 +632,8 @@ class FiniteBifield:
 
         Objects of this class represents *elements* of the finite field :math:`\\mathrm{GF}(2^k)`.
         """
-        def __eq__(self, other): return int(self) == int(other) and self.field._modulus == other.field._modulus
-        def __hash__(self): return hash((int(self), self.field._modulus))
+        def __eq__(self, other): return int(self) == int(other) and (self.field is other.field or self.field._modulus == other.field._modulus)
+        def __hash__(self): return int.__hash__(self) ^ self.field._modulus_hash
         def __add__(self, other): return self.field(self ^ other)
         def __sub__(self, other): return self.field(self ^ other)
         def __mul__(self, other): return self.field._multiply(self, other)
@@ -780,25 +924,72 @@ def xgcd(x, y, ring):
     """
     Performs the `extended Euclidean algorithm<https://en.wikipedia.org/wiki/Extended_Euclidean_algorithm>`_ with :code:`x` and :code:`y`.
     """
-    if x == ring(0):
-        return y, ring(0), ring(1)
-    else:
-        d, s, t = xgcd(y % x, x, ring)
-        return d, t - s * (y // x), s
+    zero = ring(0)
+    old_r, r = y, x
+    old_s, s = ring(1), zero
+    old_t, t = zero, ring(1)
+    while r != zero:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+        old_t, t = t, old_t - q * t
+    return old_r, old_t, old_s
 
 
 def power(x, n, ring):
     """
-    Returns :code:`x**n` using the `exponentiation by squaring<https://en.wikipedia.org/wiki/Exponentiation_by_squaring>`_ algorithm.
+    Returns :code:`x**n` using the `exponentiation by squaring<https://en.wikipedia.org/wiki/Exponentiation_by_squaring>`_ algorithm. The exponent :code:`n` must be a non-negative integer.
     """
-    if n == 0:
-        return ring(1)
-    elif n == 1:
-        return x
-    elif n % 2 == 0:
-        return power(x * x, n // 2, ring)
-    else:
-        return x * power(x * x, n // 2, ring)
+    if n < 0:
+        raise ValueError('Exponent must be non-negative')
+    result = ring(1)
+    while n > 0:
+        if n & 1:
+            result = result * x
+        n >>= 1
+        if n > 0:
+            x = x * x
+    return result
+
+
+def _polymul(a, b):
+    """
+    Returns the product of two polynomials given as lists of coefficients (lowest degree first) over any ring whose zero is falsy.
+    """
+    zero = a[0] - a[0]
+    result = [zero] * (len(a) + len(b) - 1)
+    for i, ai in enumerate(a):
+        if ai:
+            for j, bj in enumerate(b):
+                result[i + j] = result[i + j] + ai * bj
+    return result
+
+
+_KARATSUBA_THRESHOLD = 2048
+
+
+def _clmul(a, b):
+    """
+    Returns the carry-less product of the non-negative integers :code:`a` and :code:`b`. Uses shift-and-xor for small operands and `Karatsuba's algorithm <https://en.wikipedia.org/wiki/Karatsuba_algorithm>`_ for large ones.
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    if b.bit_length() <= _KARATSUBA_THRESHOLD:
+        result = 0
+        while b:
+            if b & 1:
+                result ^= a
+            a <<= 1
+            b >>= 1
+        return result
+    h = a.bit_length() // 2
+    mask = (1 << h) - 1
+    a0, a1 = a & mask, a >> h
+    b0, b1 = b & mask, b >> h
+    z0 = _clmul(a0, b0)
+    z2 = _clmul(a1, b1)
+    z1 = _clmul(a0 ^ a1, b0 ^ b1) ^ z0 ^ z2
+    return (z2 << (2 * h)) ^ (z1 << h) ^ z0
 
 
 def binary_horner(poly, x):
@@ -806,8 +997,11 @@ def binary_horner(poly, x):
     Returns the binary polynomial :code:`poly` evaluated at point :code:`x`, using `Horner's method <https://en.wikipedia.org/wiki/Horner's_method>`_.  Any Python object supporting the operations of addition, subtraction, and multiplication may serve as the input point.
     """
     result = x - x  # zero
-    for coefficient in reversed(poly.coefficients()):
-        result *= x
+    if poly.degree < 0:
+        return result
+    result += 1  # leading coefficient
+    for coefficient in reversed(poly.coefficients()[:-1]):
+        result *= x  # in place for arrays
         if coefficient:
             result += coefficient
     return result
@@ -823,46 +1017,87 @@ def horner(poly, x):
     return result
 
 
-def rref(M):
+def _pack_rows(M):
     """
-    Computes the row-reduced echelon form of the matrix M modulo 2.
+    Packs each row of the binary matrix M into :code:`uint64` words, with column :code:`j` stored in bit :code:`j % 64` of word :code:`j // 64`.
+    """
+    n_rows, n_cols = M.shape
+    n_words = -(-n_cols // 64)
+    bits = np.zeros((n_rows, 64 * n_words), dtype=np.uint8)
+    bits[:, :n_cols] = np.mod(M, 2)
+    return np.packbits(bits, axis=1, bitorder='little').view('<u8').astype(np.uint64)
 
-    Loosely based on
-    [1] https://gist.github.com/rgov/1499136
+
+def _unpack_rows(words, n_cols):
+    """
+    Inverse of :func:`_pack_rows`.
     """
-    M_rref = np.copy(M)
-    n_rows, n_cols = M_rref.shape
+    bits = np.unpackbits(words.astype('<u8').view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :n_cols]
 
-    def pivot(row):
-        f_list = np.flatnonzero(row)
-        if f_list.size > 0:
-            return f_list[0]
-        else:
-            return n_rows
 
+def _leading_columns(words, sentinel):
+    """
+    Returns the index of the first nonzero column of each packed row (see :func:`_pack_rows`), or :code:`sentinel` for all-zero rows.
+    """
+    if words.shape[1] == 0:
+        return np.full(words.shape[0], sentinel)
+    nonzero = words != 0
+    w_index = np.argmax(nonzero, axis=1)
+    w = words[np.arange(words.shape[0]), w_index]
+    lowest_bit = w & (~w + np.uint64(1))
+    bit_index = np.log2(np.where(lowest_bit == 0, 1, lowest_bit).astype(np.float64)).astype(np.int64)
+    return np.where(nonzero.any(axis=1), 64 * w_index + bit_index, sentinel)
+
+
+def _rref(M, augment=None):
+    """
+    Computes the row-reduced echelon form of the matrix :code:`[M | augment]` modulo 2. Elimination pivots on columns of both :code:`M` and :code:`augment`, but only the pivot columns lying in :code:`M` are reported. Returns the reduced :code:`M`, the reduced :code:`augment` (:code:`None` if not given), and the pivot columns of :code:`M` found during elimination.
+    """
+    M = np.asarray(M)
+    n_rows, n_cols = M.shape
+    full = M if augment is None else np.concatenate((M, augment), axis=1)
+    n_total = full.shape[1]
+    words = _pack_rows(full)
+
+    pivots = []
     for r in range(n_rows):
-        # Choose the pivot.
-        possible_pivots = [pivot(row) for row in M_rref[r:]]
-        p = np.argmin(possible_pivots) + r
+        # Choose the pivot: the row whose leading (first nonzero) column is the smallest.
+        leading = _leading_columns(words[r:], sentinel=n_total)
+        p = int(np.argmin(leading)) + r
+        f = int(leading[p - r])
+        if f >= n_total:
+            break  # Remaining rows are all zero.
 
         # Swap rows.
-        M_rref[[r, p]] = M_rref[[p, r]]
+        words[[r, p]] = words[[p, r]]
 
         # Pivot column.
-        f = pivot(M_rref[r])
-        if f >= n_cols:
-            continue
+        if f < n_cols:
+            pivots.append(f)
+
+        # Subtract the row from others (a single xor per 64 columns).
+        fw, fb = divmod(f, 64)
+        rows = np.flatnonzero((words[:, fw] >> np.uint64(fb)) & np.uint64(1))
+        rows = rows[rows != r]
+        words[rows] ^= words[r]
+
+    full_rref = _unpack_rows(words, n_total).astype(M.dtype)
+    if augment is None:
+        return full_rref, None, np.array(pivots, dtype=np.int)
+    return full_rref[:, :n_cols], full_rref[:, n_cols:], np.array(pivots, dtype=np.int)
+
 
-        # Subtract the row from others.
-        for i in range(n_rows):
-            if i != r and M_rref[i, f] != 0:
-                M_rref[i] = (M_rref[i] + M_rref[r]) % 2
+def rref(M):
+    """
+    Computes the row-reduced echelon form of the matrix M modulo 2.
 
-    return M_rref
+    Loosely based on
+    [1] https://gist.github.com/rgov/1499136
+    """
+    return _rref(M)[0]
 
 
-# TODO: this should be the main function!
-#       rref should call this instead
 def xrref(M):
     """
     Computes the row-reduced echelon form of the matrix M modulo 2.
@@ -877,36 +1112,22 @@ def xrref(M):
 
     Such that :obj:`M_rref = P @ M` (where :obj:`@` stands for matrix multiplication).
     """
-    eye = np.eye(M.shape[0], dtype=np.int)
-
-    augmented_M = np.concatenate((np.copy(M), np.copy(eye)), axis=1)
-    augmented_M_rref = rref(augmented_M)
-
-    M_rref = augmented_M_rref[:, :M.shape[1]]
-    P = augmented_M_rref[:, M.shape[1]:]
-
-    pivots = []
-    j = 0
-    while len(pivots) < M_rref.shape[0] and j < M_rref.shape[1]:
-        if np.array_equal(M_rref[:, j], eye[len(pivots)]):
-            pivots.append(j)
-        j += 1
-
-    return P, M_rref, np.array(pivots)
+    M_rref, P, pivots = _rref(M, augment=np.eye(M.shape[0], dtype=np.int))
+    return P, M_rref, pivots
 
 
 def right_inverse(M):
     P, _, s_indices = xrref(M)
-    M_rref_ri = np.zeros(M.T.shape, dtype=np.int)
-
-    M_rref_ri[s_indices] = np.eye(len(s_indices), M.shape[0])
-    M_ri = np.dot(M_rref_ri, P) % 2
+    # The right inverse of M_rref is the selection matrix with identity rows at the pivot positions, so the product
+    # with P just scatters the first rows of P to those positions (no GF(2) matrix multiplication needed).
+    M_ri = np.zeros(M.T.shape, dtype=P.dtype)
+    M_ri[s_indices] = P[:len(s_indices)]
     return M_ri
 
 
 def null_matrix(M):
     (k, n) = M.shape
-    _, M_rref, s_indices = xrref(M)
+    M_rref, _, s_indices = _rref(M)
     N = np.empty((n - k, n), dtype=np.int)
     p_indices = np.setdiff1d(np.arange(M.shape[1]), s_indices)
     N[:, p_indices] = np.eye(n - k, dtype=np.int)
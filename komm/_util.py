@@ -33,15 +33,20 @@ def binlist2int(list_):
 
 
 def _int2binlist(int_, width=None):
+    int_ = int(int_)
     if width is None:
         width = max(int_.bit_length(), 1)
-    return [(int_ >> i) & 1 for i in range(width)]
+    if width <= 16:
+        return np.array([(int_ >> i) & 1 for i in range(width)])
+    # For wide integers, a single np.unpackbits beats the per-bit Python loop.
+    bytes_ = (int_ & ((1 << width) - 1)).to_bytes((width + 7) // 8, byteorder='little')
+    return np.unpackbits(np.frombuffer(bytes_, dtype=np.uint8), count=width, bitorder='little').astype(np.int)
 
 def int2binlist(int_, width=None):
     """
     Converts an integer to its bit array representation.
     """
-    return np.array(_int2binlist(int_, width))
+    return _int2binlist(int_, width)
 
 
 def _pack(list_, width):
@@ -55,6 +60,8 @@ def pack(list_, width):
 
 
 def _unpack(list_, width):
+    if width < 64:
+        return np.ravel((np.asarray(list_, dtype=np.int64)[:, np.newaxis] >> np.arange(width)) & 1)
     return np.ravel([_int2binlist(i, width=width) for i in list_])
 
 def unpack(list_, width):
@@ -23,6 +23,6 @@ setup(
         'Documentation': 'http://komm.readthedocs.io/',
         'Source': 'https://github.com/rwnobrega/komm/'},
     packages=find_packages(exclude=['contrib', 'docs', 'tests*']),
-    install_requires=['numpy', 'scipy'],
+    install_requires=['numpy>=1.17', 'scipy'],
     python_requires='>=3.4',
 )
@@ -15,6 +15,9 @@ def test_binary_polynomial():
     assert poly >> 2 == komm.BinaryPolynomial(0b101001101)
     assert poly << 2 == komm.BinaryPolynomial(0b1010011011100)
     assert poly ** 2 == komm.BinaryPolynomial(0b100010000010100010101)
+    assert poly ** 0 == komm.BinaryPolynomial(0b1)
+    with pytest.raises(ValueError):
+        poly ** -1
     assert poly.evaluate(2) == 0b10100110111
     assert poly.evaluate(10) == 10100110111
     assert poly.evaluate(16) == 0x10100110111
@@ -33,6 +36,8 @@ def test_binary_polynomial():
     assert divmod(poly_dividend, poly_divisor) == (poly_quotient, poly_remainder)
     assert poly_dividend // poly_divisor == poly_quotient
     assert poly_dividend % poly_divisor == poly_remainder
+    with pytest.raises(ZeroDivisionError):
+        divmod(poly_dividend, komm.BinaryPolynomial(0))
 
     poly0 = komm.BinaryPolynomial(0b1101011)
     poly1 = komm.BinaryPolynomial(0b11011)
@@ -42,6 +47,24 @@ def test_binary_polynomial():
     assert komm.BinaryPolynomial.gcd(poly0, poly1) == poly_gcd
     assert komm.BinaryPolynomial.lcm(poly0, poly1) == poly_lcm
 
+    # Large operands (Karatsuba branch), checked against plain shift-and-xor.
+    def shift_xor_product(a, b):
+        result = 0
+        while b:
+            if b & 1:
+                result ^= a
+            a, b = a << 1, b >> 1
+        return result
+
+    rng = np.random.default_rng(42)
+    for bits0, bits1 in [(5000, 5000), (5003, 2100), (4999, 6001)]:
+        a = int(''.join(map(str, rng.integers(0, 2, bits0 - 1))), 2) | (1 << (bits0 - 1))
+        b = int(''.join(map(str, rng.integers(0, 2, bits1 - 1))), 2) | (1 << (bits1 - 1))
+        p, q = komm.BinaryPolynomial(a), komm.BinaryPolynomial(b)
+        assert int(p * q) == int(q * p) == shift_xor_product(a, b)
+        assert (p * q) // q == p
+        assert (p * q) % q == komm.BinaryPolynomial(0)
+
 
 def test_finite_bifield():
     """
@@ -56,6 +79,34 @@ def test_finite_bifield():
     assert alpha**7 == one + alpha + alpha**3 == alpha**4 / alpha**12 == alpha**12 / alpha**5 == field(0b1011)
     assert alpha**13 == alpha**5 + alpha**7 == field(0b1101)
     assert one + alpha**5 + alpha**10 == field(0)
+    assert alpha**(2**62 + 1) == alpha**5 == field(0b0110)
+    assert alpha**(2**63) == alpha**8 == field(0b0101)
+
+
+def test_finite_bifield_degree_one():
+    field = komm.FiniteBifield(1)
+    alpha = field.primitive_element
+    one = field(1)
+    assert alpha == one
+    assert alpha * alpha == alpha**3 == alpha.inverse() == one
+    assert alpha.logarithm() == 0
+    assert alpha.conjugates() == [one]
+    assert alpha.minimal_polynomial() == komm.BinaryPolynomial(0b11)
+
+
+def test_finite_bifield_unreduced_operands():
+    field = komm.FiniteBifield(4, 0b10011)
+    x = field(0b10100)  # X^4 + X^2, congruent to X^2 + X + 1
+    y = field(0b0111)
+    assert x * field(0b11) == y * field(0b11) == field(0b1001)
+    assert field(0b10011) * field(0b11) == field(0)
+    assert x**2 == y**2
+    assert x.inverse() == y.inverse()
+    assert x.logarithm() == y.logarithm() == 10
+    assert x.conjugates() == y.conjugates()
+    assert x.minimal_polynomial() == y.minimal_polynomial()
+    assert np.array_equal(field.multiply_vec([0b10100], [0b11]), [0b1001])
+    assert np.array_equal(field.power_vec([0b10100], 2), [int(y**2)])
 
 
 def test_conjugates():
@@ -102,6 +153,38 @@ def test_logarithm(m):
         assert (alpha**i).logarithm() == i
 
 
+@pytest.mark.parametrize('modulus', [0b10011, 0b11111])
+def test_vectorized_operations(modulus):
+    field = komm.FiniteBifield(4, modulus)
+    x, y = np.meshgrid(np.arange(field.order), np.arange(field.order))
+    assert np.array_equal(field.multiply_vec(x, y), [[field(a) * field(b) for a in range(field.order)] for b in range(field.order)])
+    assert np.array_equal(field.power_vec(x[0], 7), [field(a)**7 for a in range(field.order)])
+    assert np.array_equal(field.power_vec(x[0, 1:], -2), [field(a)**(-2) for a in range(1, field.order)])
+    assert np.array_equal(field.power_vec(x[0], 2**62 + 1), [field(a)**(2**62 + 1) for a in range(field.order)])
+
+
+def test_large_degree():
+    field = komm.FiniteBifield(20, 0b100000000000000001001)
+    modulus = komm.BinaryPolynomial(0b100000000000000001001)
+    for x, y in [(0b11010011101, 0b11111111111111111111), (0b10000000000000000000, 0b10), (12345, 678910)]:
+        product = (komm.BinaryPolynomial(x) * komm.BinaryPolynomial(y)) % modulus
+        assert field(x) * field(y) == field(int(product))
+        assert field(x) * field(x).inverse() == field(1)
+    alpha = field.primitive_element
+    assert (alpha**123456).logarithm() == 123456
+    assert field(1).logarithm(field(0)) == 0
+    assert field(0).logarithm(field(0)) == 1
+    assert field(5).logarithm(field(0)) == -1
+
+
+def test_non_primitive_modulus():
+    field = komm.FiniteBifield(4, 0b11111)  # irreducible, but not primitive
+    for i in range(1, field.order):
+        a = field(i)
+        assert a * a.inverse() == field(1)
+        assert a**3 == a * a * a
+
+
 def test_rational_polynomial():
     assert komm.RationalPolynomial([1, 0, -1]) == komm.RationalPolynomial([1, 0, -1, 0, 0, 0])
 
@@ -166,3 +249,34 @@ def test_rational_polynomial_fractions():
     fraction = komm.RationalPolynomialFraction([0, '5/14'], [0, 0, 0, '55/21'])
     assert fraction.numerator == komm.RationalPolynomial([3])
     assert fraction.denominator == komm.RationalPolynomial([0, 0, 22])
+
+
+def test_rref():
+    from komm._algebra import rref, xrref
+    M = np.array([[0, 0, 0, 0, 1], [0, 0, 0, 0, 0], [0, 1, 1, 0, 1]])
+    assert np.array_equal(rref(M), [[0, 1, 1, 0, 0], [0, 0, 0, 0, 1], [0, 0, 0, 0, 0]])
+    P, M_rref, pivots = xrref(M)
+    assert np.array_equal(np.dot(P, M) % 2, M_rref)
+    assert np.array_equal(pivots, [1, 4])
+    assert rref(np.zeros((3, 0), dtype=int)).shape == (3, 0)
+
+
+@pytest.mark.parametrize('zero_columns', [0, 64, 66, 120])
+def test_rref_multiword(zero_columns):
+    from komm._algebra import rref, xrref
+    rng = np.random.default_rng(zero_columns)
+    M = rng.integers(0, 2, size=(5, 130))
+    M[:, :zero_columns] = 0  # forces pivots at or beyond the word boundary
+    M[4] = M[0] ^ M[1]  # rank-deficient
+    P, M_rref, pivots = xrref(M)
+    assert np.array_equal(rref(M), M_rref)
+    assert np.array_equal(np.dot(P, M) % 2, M_rref)
+    leading = [np.flatnonzero(row)[0] for row in M_rref if row.any()]
+    assert np.array_equal(pivots, leading)
+    assert np.all(np.diff(pivots) > 0) and pivots[0] >= zero_columns
+    assert np.array_equal(M_rref[:len(pivots), pivots], np.eye(len(pivots)))
+    assert not M_rref[len(pivots):].any()
+    assert len(pivots) == 4
+    E = np.zeros((3, 130), dtype=int)
+    E[0, [127, 129]] = E[1, [63, 64]] = E[2, 129] = 1  # pivots at bit 63 of the first and second words
+    assert np.array_equal(xrref(E)[2], [63, 127, 129])
@@ -14,3 +14,14 @@ def test_entropy():
 
 def test_mutual_information():
     pass
+
+def test_int2binlist():
+    assert np.array_equal(komm.int2binlist(0b1101), [1, 0, 1, 1])
+    assert np.array_equal(komm.int2binlist(0b1101, width=6), [1, 0, 1, 1, 0, 0])
+    assert np.array_equal(komm.int2binlist(2**40 + 1), [1] + [0] * 39 + [1])
+    assert np.array_equal(komm.int2binlist(2**40 + 1, width=20), [1] + [0] * 19)
+
+def test_pack_unpack():
+    bits = [1, 0, 1, 1, 0, 0, 1, 1, 1]
+    assert np.array_equal(komm.pack(bits, width=3), [5, 1, 7])
+    assert np.array_equal(komm.unpack([5, 1, 7], width=3), bits)